@@ -36,3 +36,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     domain_data.set_entry_data(entry, entry_data)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
+
+
+async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Unload the Silla Prism component."""
+    _LOGGER.debug("async_unload_entry for Silla Prism")
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        DomainData.get(hass).pop_entry_data(entry).cancel_expiries()
+    return unload_ok
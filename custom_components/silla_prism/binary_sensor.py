@@ -13,7 +13,6 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_call_later
 
 from .domain_data import DomainData
 from .entity import PrismBaseEntity
@@ -70,6 +69,7 @@ class PrismBinarySensor(PrismBaseEntity, BinarySensorEntity):
         super().__init__(entry_data, "binary_sensor", description)
         self._attr_is_on = False
 
+    @callback
     @override
     def _message_received(self, msg) -> None:
         """Update the sensor with the most recent event."""
@@ -78,7 +78,7 @@ class PrismBinarySensor(PrismBaseEntity, BinarySensorEntity):
         # Handle online presence
         if not self._attr_is_on:
             self._attr_is_on = True
-            self.schedule_update_ha_state()
+            self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to mqtt."""
@@ -107,6 +107,7 @@ class PrismEventBinarySensor(PrismBinarySensor):
         super().__init__(entry_data, description)
         self._sequence: FrozenSet[int] = description.sequence
 
+    @callback
     def _message_received(self, msg) -> None:
         """Update the sensor with the most recent event."""
         self.schedule_expiration_callback()
@@ -120,10 +121,10 @@ class PrismEventBinarySensor(PrismBinarySensor):
                     if self._sequence[i] != s:
                         break
             self._attr_is_on = True
-            self._expiration_trigger = async_call_later(
-                self.hass, 2.0, self._restore_value
+            self._expiration_trigger = self.hass.loop.call_later(
+                2.0, self._restore_value
             )
-            self.schedule_update_ha_state()
+            self.async_write_ha_state()
         except ValueError:
             pass
 
@@ -25,6 +25,10 @@ class DomainData:
         assert entry.entry_id not in self._entry_datas, "Entry data already set!"
         self._entry_datas[entry.entry_id] = entry_data
 
+    def pop_entry_data(self, entry: ConfigEntry) -> RuntimeEntryData:
+        """Pop the runtime entry data instance associated with this config entry."""
+        return self._entry_datas.pop(entry.entry_id)
+
     @classmethod
     def get(cls, hass: HomeAssistant) -> Self:
         """Get the global DomainData instance stored in hass.data."""
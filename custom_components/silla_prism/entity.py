@@ -1,12 +1,13 @@
 """Contains sensors exposed by the Prism integration."""
 
+import asyncio
 from datetime import datetime
 import logging
 
-from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.components import mqtt
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity, EntityDescription
-from homeassistant.helpers.event import async_call_later
 
 from .entry_data import RuntimeEntryData
 
@@ -27,7 +28,7 @@ class PrismBaseEntity(Entity):
     """A base Entity that is registered under a Prism device."""
 
     _expire_after: int | None
-    _expiration_trigger: CALLBACK_TYPE | None = None
+    _expiration_trigger: asyncio.TimerHandle | None = None
     _attr_should_poll = False
 
     def __init__(
@@ -56,29 +57,29 @@ class PrismBaseEntity(Entity):
         """Triggered when value is expired."""
         _LOGGER.debug("entity _value_is_expired for topic %s", self._topic)
         self._expiration_trigger = None
+        if not self._attr_available:
+            return
         self._attr_available = False
         self.async_write_ha_state()
 
     async def _subscribe_topic(self):
         """Subscribe to mqtt topic."""
         _LOGGER.debug("_subscribe_topic: %s", self._topic)
-        self._unsubscribe = await self.hass.components.mqtt.async_subscribe(
-            self._topic, self.message_received
+        self._unsubscribe = await mqtt.async_subscribe(
+            self.hass, self._topic, self._message_received
         )
 
+    @callback
     def _message_received(self, msg) -> None:
         """Change the selected option."""
         raise NotImplementedError
 
-    def message_received(self, msg) -> None:
-        """Update the sensor with the most recent event."""
-        self.hass.loop.call_soon_threadsafe(self._message_received, msg)
-
     async def _unsubscribe_topic(self):
         """Unsubscribe to mqtt topic."""
         _LOGGER.debug("_unsubscribe_topic: %s", self._topic)
         if self._unsubscribe is not None:
-            await self._unsubscribe()
+            self._unsubscribe()
+            self._unsubscribe = None
 
     def schedule_expiration_callback(self) -> None:
         """When self._expire_after is set, and we receive a message, assume device is not expired since it has to be to receive the message."""
@@ -86,15 +87,15 @@ class PrismBaseEntity(Entity):
             self._attr_available = True
             # Reset old trigger
             if self._expiration_trigger:
-                self._expiration_trigger()
+                self._expiration_trigger.cancel()
             # Set new trigger
-            self._expiration_trigger = async_call_later(
-                self.hass, self._expire_after, self._value_is_expired
+            self._expiration_trigger = self.hass.loop.call_later(
+                self._expire_after, self._value_is_expired
             )
 
     def cleanup_expiration_trigger(self) -> None:
         """Clean up expiration triggers."""
         if self._expiration_trigger:
-            self._expiration_trigger()
+            self._expiration_trigger.cancel()
             self._expiration_trigger = None
             self._attr_available = True
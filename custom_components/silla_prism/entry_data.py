@@ -1,6 +1,11 @@
 """Runtime entry data for Silla Prism stored in hass.data."""
 
-from dataclasses import dataclass
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import heapq
+
+from homeassistant.components.mqtt import ReceiveMessage
 from homeassistant.helpers.device_registry import DeviceInfo
 
 
@@ -11,3 +16,50 @@ class RuntimeEntryData:
     topic: str
     vsensors: bool
     device: DeviceInfo
+    mqtt_dispatch: dict[str, Callable[[ReceiveMessage], None]] = field(
+        default_factory=dict
+    )
+    mqtt_pending: dict[str, ReceiveMessage] = field(default_factory=dict)
+    expiry_heap: list[tuple[float, str, Callable[[], None]]] = field(
+        default_factory=list
+    )
+    expiry_handle: asyncio.TimerHandle | None = None
+
+    def schedule_expiry(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        deadline: float,
+        key: str,
+        action: Callable[[], None],
+    ) -> None:
+        """Queue an expiry action, re-arm the timer only if it is the earliest."""
+        item = (deadline, key, action)
+        heapq.heappush(self.expiry_heap, item)
+        if self.expiry_heap[0] is item:
+            if self.expiry_handle is not None:
+                self.expiry_handle.cancel()
+            self.expiry_handle = loop.call_at(deadline, self._fire_expiries, loop)
+
+    def remove_expiry(self, key: str) -> None:
+        """Drop the queued expiry actions registered under key."""
+        heap = self.expiry_heap
+        heap[:] = [item for item in heap if item[1] != key]
+        heapq.heapify(heap)
+
+    def cancel_expiries(self) -> None:
+        """Drop all the queued expiry actions."""
+        if self.expiry_handle is not None:
+            self.expiry_handle.cancel()
+            self.expiry_handle = None
+        self.expiry_heap.clear()
+
+    def _fire_expiries(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Run the due expiry actions and re-arm for the next one."""
+        self.expiry_handle = None
+        heap = self.expiry_heap
+        now = loop.time()
+        while heap and heap[0][0] <= now:
+            heapq.heappop(heap)[2]()
+        # An action may have re-queued itself and armed the timer already
+        if heap and self.expiry_handle is None:
+            self.expiry_handle = loop.call_at(heap[0][0], self._fire_expiries, loop)
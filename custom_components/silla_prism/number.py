@@ -8,7 +8,7 @@ from homeassistant.components.number import NumberEntity, NumberEntityDescriptio
 from homeassistant.components.number.const import NumberDeviceClass, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .domain_data import DomainData
@@ -53,11 +53,12 @@ class PrismNumber(PrismBaseEntity, NumberEntity):
         self._topic_out = entry_data.topic + description.topic_out
         self._attr_native_value = self.native_min_value
 
+    @callback
     @override
     def _message_received(self, msg) -> None:
         """Update the sensor with the most recent event."""
         self._attr_native_value = msg.payload
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to mqtt."""
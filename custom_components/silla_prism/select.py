@@ -7,7 +7,7 @@ from homeassistant.components import mqtt
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .domain_data import DomainData
@@ -52,6 +52,7 @@ class PrismSelect(PrismBaseEntity, SelectEntity):
         self._topic_out = entry_data.topic + description.topic_out
         self._attr_current_option = "normal"
 
+    @callback
     @override
     def _message_received(self, msg) -> None:
         """Update the sensor with the most recent event."""
@@ -59,7 +60,7 @@ class PrismSelect(PrismBaseEntity, SelectEntity):
             _sel = int(msg.payload) - 1
             if _sel >= 0 and _sel < len(self.options):
                 self._attr_current_option = self.options[_sel]
-                self.schedule_update_ha_state()
+                self.async_write_ha_state()
         except ValueError:
             pass
 
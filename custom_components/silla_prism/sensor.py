@@ -6,6 +6,8 @@ from decimal import Decimal
 import logging
 from typing import List
 
+from homeassistant.components import mqtt
+from homeassistant.components.mqtt import ReceiveMessage
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
@@ -25,7 +27,7 @@ from homeassistant.const import (
 from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
 from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_call_later, async_track_state_change_event
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from .const import DOMAIN
@@ -36,6 +38,16 @@ from .entry_data import RuntimeEntryData
 
 _LOGGER = logging.getLogger(__name__)
 
+# Device classes rounded on ingest when displayed without decimals
+ROUNDED_DEVICE_CLASSES = frozenset(
+    (
+        SensorDeviceClass.ENERGY,
+        SensorDeviceClass.POWER,
+        SensorDeviceClass.CURRENT,
+        SensorDeviceClass.VOLTAGE,
+    )
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -43,9 +55,28 @@ async def async_setup_entry(
     """Set up all sensors for this entry."""
     entry_data: RuntimeEntryData = DomainData.get(hass).get_entry_data(entry)
     _LOGGER.debug("async_setup_entry for sensors: %s", entry_data)
+    dispatch = entry_data.mqtt_dispatch
+    pending = entry_data.mqtt_pending
+    sensor_topics = {entry_data.topic + description.topic for description in SENSORS}
+
+    @callback
+    def _dispatch_message(msg: ReceiveMessage) -> None:
+        """Route a message to the handler registered for its topic."""
+        if (handler := dispatch.get(msg.topic)) is not None:
+            handler(msg)
+        elif msg.topic in sensor_topics:
+            # Sensor not added yet, keep the last (retained) value for it
+            pending[msg.topic] = msg
+
+    # One subscription per sensor topic, all routed through the same dispatcher
+    for topic in sensor_topics:
+        entry.async_on_unload(
+            await mqtt.async_subscribe(hass, topic, _dispatch_message)
+        )
+
     sensors = [PrismSensor(entry_data, description) for description in SENSORS]
     sensors.append(PrismGriEnergy(entry_data, VSENSORS[0]))
-    async_add_entities(sensors)
+    async_add_entities(sensors, False)
 
 
 class PrismSensorEntityDescription(SensorEntityDescription, frozen_or_thawed=True):
@@ -122,6 +153,24 @@ class PrismGriEnergy(SensorEntity, RestoreEntity):
         self.async_write_ha_state()
 
 
+def _handle_enum(entity: "PrismSensor", msg: ReceiveMessage) -> str | None:
+    """Decode a 1-based enum index payload into its option."""
+    payload = msg.payload
+    # Single digit payloads ("1".."9") skip the int parser
+    idx = ord(payload) - 0x31 if len(payload) == 1 else int(payload) - 1
+    return entity._options_tuple[idx] if 0 <= idx < entity._options_len else None
+
+
+def _handle_rounded(entity: "PrismSensor", msg: ReceiveMessage) -> int:
+    """Round a numeric payload to the displayed precision."""
+    return round(float(msg.payload))
+
+
+def _handle_raw(entity: "PrismSensor", msg: ReceiveMessage) -> str:
+    """Pass the payload through as the native value."""
+    return msg.payload
+
+
 class PrismSensor(PrismBaseEntity, SensorEntity):
     """A Sensor for Prism EBSE devices."""
 
@@ -132,71 +181,91 @@ class PrismSensor(PrismBaseEntity, SensorEntity):
     ) -> None:
         """Init Prism sensor."""
         super().__init__(entry_data, "sensor", description)
-        self._unsubscribe = None
-
-    async def _subscribe_topic(self):
-        """Subscribe to mqtt topic."""
-        _LOGGER.debug("_subscribe_topic: %s", self._topic)
-        self._unsubscribe = await self.hass.components.mqtt.async_subscribe(
-            self._topic, self.message_received
-        )
+        self._entry_data = entry_data
+        # Cache enum options and pick the payload decoder once
+        self._options_tuple = tuple(description.options or ())
+        self._options_len = len(self._options_tuple)
+        if description.options:
+            self._handle = _handle_enum
+        elif (
+            description.suggested_display_precision == 0
+            and description.device_class in ROUNDED_DEVICE_CLASSES
+        ):
+            self._handle = _handle_rounded
+        else:
+            self._handle = _handle_raw
+        # Expiration deadline, queued on the entry only when not already queued
+        self._expire_deadline: float = 0.0
+        self._expire_scheduled = False
 
-    async def _unsubscribe_topic(self):
-        """Unsubscribe to mqtt topic."""
-        _LOGGER.debug("_unsubscribe_topic: %s", self._topic)
-        if self._unsubscribe is not None:
-            await self._unsubscribe()
+    @callback
+    def _on_expire_timer(self) -> None:
+        """Expire the value or re-queue it if the deadline has moved."""
+        if self.hass.loop.time() < self._expire_deadline:
+            self._entry_data.schedule_expiry(
+                self.hass.loop,
+                self._expire_deadline,
+                self._topic,
+                self._on_expire_timer,
+            )
+            return
+        self._expire_scheduled = False
+        self._value_is_expired()
 
     @callback
     def _value_is_expired(self, *_: datetime) -> None:
         """Triggered when value is expired."""
         _LOGGER.debug("_value_is_expired %s", self._topic)
-        self._expiration_trigger = None
+        if not self._attr_available:
+            return
         self._attr_available = False
         self.async_write_ha_state()
 
+    @callback
     def _message_received(self, msg) -> None:
         """Update the sensor with the most recent event."""
-        # _LOGGER.debug("_message_received %s %s", self._topic, msg.payload)
+        was_available = self._attr_available
         if self._expire_after is not None and self._expire_after > 0:
             # When self._expire_after is set, and we receive a message, assume
             # device is not expired since it has to be to receive the message
             self._attr_available = True
-            # Reset old trigger
-            if self._expiration_trigger:
-                self._expiration_trigger()
-            # Set new trigger
-            self._expiration_trigger = async_call_later(
-                self.hass, self._expire_after, self._value_is_expired
-            )
-        # Update native value
-        if self.options is not None:
-            try:
-                self._attr_native_value = self.options[int(msg.payload) - 1]
-            except IndexError:
-                self._attr_native_value = None
-        else:
-            self._attr_native_value = msg.payload
-        # Schedule update ha state
-        self.schedule_update_ha_state()
+            # Move the deadline forward, queue the expiry only if not pending
+            self._expire_deadline = self.hass.loop.time() + self._expire_after
+            if not self._expire_scheduled:
+                self._expire_scheduled = True
+                self._entry_data.schedule_expiry(
+                    self.hass.loop,
+                    self._expire_deadline,
+                    self._topic,
+                    self._on_expire_timer,
+                )
+        new_value = self._handle(self, msg)
+        # Nothing changed, skip the state write
+        if new_value == self._attr_native_value and was_available:
+            return
+        self._attr_native_value = new_value
+        # Already on the event loop, write the state directly
+        self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
-        """Subscribe to mqtt."""
+        """Register to the entry mqtt dispatcher."""
         # _LOGGER.debug("async_added_to_hass")
         self._attr_available = False
-        await self._subscribe_topic()
+        self._entry_data.mqtt_dispatch[self._topic] = self._message_received
+        # Replay the value received before the sensor was registered
+        if (msg := self._entry_data.mqtt_pending.pop(self._topic, None)) is not None:
+            self._message_received(msg)
 
     async def async_will_remove_from_hass(self) -> None:
-        """Unsubscribe from mqtt."""
+        """Unregister from the entry mqtt dispatcher."""
         _LOGGER.debug("called async_will_remove_from_hass fir %s", self.entity_id)
         await super().async_will_remove_from_hass()
-        # Clean up expire triggers
-        if self._expiration_trigger:
-            self._expiration_trigger()
-            self._expiration_trigger = None
+        self._entry_data.mqtt_dispatch.pop(self._topic, None)
+        # Clean up expire trigger and drop its queued entry
+        if self._expire_scheduled:
+            self._expire_scheduled = False
+            self._entry_data.remove_expiry(self._topic)
             self._attr_available = True
-        if self._unsubscribe is not None:
-            await self._unsubscribe_topic()
 
 
 SENSORS: tuple[PrismSensorEntityDescription, ...] = (
@@ -204,7 +273,7 @@ SENSORS: tuple[PrismSensorEntityDescription, ...] = (
         key="current_state",
         topic="1/state",
         device_class=SensorDeviceClass.ENUM,
-        options=["idle", "waiting", "charging", "pause"],
+        options=("idle", "waiting", "charging", "pause"),
         has_entity_name=True,
         translation_key="current_state",
     ),
@@ -293,7 +362,7 @@ SENSORS: tuple[PrismSensorEntityDescription, ...] = (
         key="current_port_mode",
         topic="1/mode",
         device_class=SensorDeviceClass.ENUM,
-        options=["solar", "normal", "paused", "suspended"],
+        options=("solar", "normal", "paused", "suspended"),
         has_entity_name=True,
         translation_key="current_port_mode",
     ),